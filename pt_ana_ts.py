@@ -7,19 +7,25 @@
 # Copyright (C) 2023 Yeh, Hsin-Hsien <yhh76227@gmail.com>
 #
 import argparse
+import functools
 import gzip
+import itertools
+import operator
 import os
 import re
+import sys
 
 import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 
 from .utils.common import PKG_VERSION, PT_TS_VER
 from .utils.primetime_ts import Pin, TimePath, TimeReport
 
 VERSION = f"pt_ana_ts version {PT_TS_VER} ({PKG_VERSION})"
 
+_RULE = " " + "=" * 60     # section ruler of the path summary
+_SUBRULE = " " + "-" * 60  # sub-section ruler of the path summary
+_FMT_VAL = " {:26}{: 5.4f}".format  # value line of the path summary
+
 
 ##############################################################################
 ### Function
@@ -38,6 +44,90 @@ class Palette:
     )
 
 
+### config line shapes
+_LINE_RE = re.compile(r"(?P<key>[^:]*?)\s*:\s*(?P<val>[^:]*)")  # key: value
+_WORD_RE = re.compile(r"\S+")                         # <pattern> [...]
+_CKT_RE = re.compile(r"([ynYN])\s+(\S+)")             # <y|n> <pattern>
+_TAG_PAT_RE = re.compile(r"(\S+)\s+(\S+)")            # <tag> <pattern>
+_HCD_RE = re.compile(                                 # <cell> <pi> <po> <tag>
+            r'([^\s"]+)\s+([^\s"]+)\s+([^\s"]+)'
+            r'(?:\s*"([^"]*)"?.*|\s+([^\s"]+))')
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(pat: str) -> re.Pattern:
+    """Compile a config pattern (cached by pattern string)."""
+    return re.compile(pat)
+
+
+def _h_bds(cons_cfg: dict, value: str):
+    """Config handler: bar view data type set."""
+    tag, *pat = value.split()
+    cons_cfg['bds'][tag] = pat
+
+
+def _h_ckt(cons_cfg: dict, value: str):
+    """Config handler: clock cell type."""
+    if (m:=_CKT_RE.fullmatch(value)) is None:
+        raise SyntaxError("expected 'ckt: <y|n> <pattern>'")
+    tag, pat = m.groups()
+    cons_cfg['ckt'].append((tag in 'yY', _compile(pat)))
+
+
+def _h_ckp(cons_cfg: dict, value: str):
+    """Config handler: user-defined clock cell pin."""
+    type_, *pat = value.split()
+    match type_:
+        case 'c': cons_cfg['ckpc'].update(pat)
+        case 'i': cons_cfg['ckpi'].update(pat)
+        case 'r': cons_cfg['ckpr'].extend([_compile(i) for i in pat])
+        case  _ : raise SyntaxError(f"unknown ckp type '{type_}'")
+
+
+def _h_ckm(cons_cfg: dict, value: str):
+    """Config handler: user-defined clock module."""
+    if (m:=_WORD_RE.match(value)) is None:
+        raise SyntaxError("expected 'ckm: <pattern>'")
+    cons_cfg['ckm'].append(_compile(m.group()))
+
+
+def _h_dpc(cons_cfg: dict, value: str):
+    """Config handler: specific group for the default path."""
+    cons_cfg['dpc'] = value
+
+
+def _h_pc(cons_cfg: dict, value: str):
+    """Config handler: path classification."""
+    if (m:=_TAG_PAT_RE.fullmatch(value)) is None:
+        raise SyntaxError("expected 'pc: <tag> <pattern>'")
+    tag, pat = m.groups()
+    cons_cfg['pc'][tag] = _compile(pat)
+
+
+def _h_cc(cons_cfg: dict, value: str):
+    """Config handler: cell classification."""
+    if (m:=_TAG_PAT_RE.fullmatch(value)) is None:
+        raise SyntaxError("expected 'cc: <tag> <pattern>'")
+    tag, pat = m.groups()
+    cons_cfg['cc'][tag] = _compile(pat)
+
+
+def _h_hcd(cons_cfg: dict, value: str):
+    """Config handler: highlight cell delay."""
+    if (m:=_HCD_RE.fullmatch(value)) is None:
+        raise SyntaxError("expected 'hcd: <cell> <from pin> <to pin> <tag>'")
+    type_, pi, po, qtag, tag = m.groups()
+    if qtag is not None:
+        tag = qtag
+    cons_cfg['hcd'].setdefault(type_, {})[f"{pi}:{po}"] = tag
+
+
+_HANDLERS = {
+    'bds': _h_bds, 'ckt': _h_ckt, 'ckp': _h_ckp, 'ckm': _h_ckm,
+    'dpc': _h_dpc, 'pc': _h_pc, 'cc': _h_cc, 'hcd': _h_hcd,
+}
+
+
 def load_times_cfg(cfg_fp) -> dict:
     """Load configuration."""
     attr = {
@@ -67,58 +157,37 @@ def load_times_cfg(cfg_fp) -> dict:
         return cons_cfg
 
     with open(cfg_fp, 'r') as fp:
-        for fno, line in enumerate(fp, 1):
-            line = line.split('#')[0].strip()
-            if line:
-                try:
-                    key, value = line.split(':')
-                    key, value = key.strip(), value.strip()
-                    if key in attr:
-                        change_value = str(not attr[key][1]).lower()
-                        if value.lower() == change_value:
-                            cons_cfg[attr[key][0]] = not attr[key][1]
-                        else:
-                            cons_cfg[attr[key][0]] = attr[key][1]
-                    elif key == 'bds':
-                        tag, *pat = value.split()
-                        cons_cfg['bds'][tag] = pat
-                    elif key == 'ckt':
-                        tag, pat = value.split()
-                        pat_re = re.compile(pat)
-                        match tag.lower():
-                            case 'y': tag = True
-                            case 'n': tag = False
-                            case  _ : raise SyntaxError
-                        cons_cfg['ckt'].append((tag, pat_re))
-                    elif key == 'ckp':
-                        type_, *pat = value.split()
-                        match type_:
-                            case 'c': cons_cfg['ckpc'].update(pat)
-                            case 'i': cons_cfg['ckpi'].update(pat)
-                            case 'r': cons_cfg['ckpr'].extend(
-                                        [re.compile(i) for i in pat])
-                            case  _ : raise SyntaxError
-                    elif key == 'ckm':
-                        pat = re.compile(value.split()[0])
-                        cons_cfg['ckm'].append(pat)
-                    elif key == 'dpc':
-                        cons_cfg['dpc'] = value
-                    elif key == 'pc':
-                        tag, pat = value.split()
-                        cons_cfg['pc'][tag] = re.compile(pat)
-                    elif key == 'cc':
-                        tag, pat = value.split()
-                        cons_cfg['cc'][tag] = re.compile(pat)
-                    elif key == 'hcd':
-                        toks = value.split('"') 
-                        if len(toks) > 1:
-                            type_, pi, po, tag = *toks[0].split(), toks[1]
-                        else:
-                            type_, pi, po, tag = toks[0].split()
-                        hcd_dict = cons_cfg['hcd'].setdefault(type_, {})
-                        cons_cfg['hcd'][type_][f"{pi}:{po}"] = tag
-                except SyntaxError:
-                    raise SyntaxError(f"config syntax error (ln:{fno})")
+        lines = fp.read().splitlines()
+
+    entries = [(fno, line) for fno, raw in enumerate(lines, 1) 
+               if (line:=raw.partition('#')[0].strip())]
+
+    for fno, line in entries:
+        try:
+            if (m:=_LINE_RE.fullmatch(line)) is None:
+                raise SyntaxError("expected '<key>: <value>'")
+            key, value = m.group('key', 'val')
+            if key in attr:
+                cfg_key, default = attr[key]
+                if value.lower() == str(not default).lower():
+                    cons_cfg[cfg_key] = not default
+                else:
+                    cons_cfg[cfg_key] = default
+            elif (handler:=_HANDLERS.get(key)) is not None:
+                handler(cons_cfg, value)
+        except (ValueError, SyntaxError, re.error) as e:
+            raise SyntaxError(
+                f"config syntax error (ln:{fno}): {e}") from None
+
+    # merge the instance clock pin patterns into one alternation
+    # (group-free only: merging renumbers groups and breaks backreferences)
+    ckpr = cons_cfg['ckpr']
+    if len(ckpr) > 1 and not any(pat_re.groups for pat_re in ckpr):
+        try:
+            cons_cfg['ckpr'] = [_compile('|'.join(
+                f"(?:{pat_re.pattern})" for pat_re in ckpr))]
+        except re.error:
+            pass
 
     if cons_cfg['dpc'] is not None and cons_cfg['dpc'] not in cons_cfg['pc']:
         print(" [INFO] Specific group for default path isn't existed," + 
@@ -154,117 +223,150 @@ def report_summary(args, range_list: list):
                 print(line)
         return
 
+    ## derived values of all paths (evaluated column-wise)
+    npath = len(time_rpt.path)
+    col = {key: np.fromiter(map(operator.attrgetter(key), time_rpt.path), 
+                            dtype=np.float64, count=npath)
+           for key in ('arr', 'idly', 'slat', 'sev', 'elat', 'crpr')}
+    dlat_list = (col['arr'] - col['idly'] - col['slat'] - col['sev']).tolist()
+    skew_list = (col['slat'] - col['elat'] - col['crpr']).tolist()
+
+    ## report options (invariant over paths)
+    slk_on_rpt = cons_cfg['slk_on_rpt']
+    unce_on_rpt = cons_cfg['unce_on_rpt']
+    lib_on_rpt = cons_cfg['lib_on_rpt']
+    ck_skew_on_rpt = cons_cfg['ck_skew_on_rpt']
+    seg_dlat_on_rpt = cons_cfg['seg_dlat_on_rpt']
+    seg_ddt_on_rpt = cons_cfg['seg_ddt_on_rpt']
+    seg_slat_on_rpt = cons_cfg['seg_slat_on_rpt']
+    seg_sdt_on_rpt = cons_cfg['seg_sdt_on_rpt']
+    seg_elat_on_rpt = cons_cfg['seg_elat_on_rpt']
+    seg_edt_on_rpt = cons_cfg['seg_edt_on_rpt']
+    ckc_en = args.ckc_en or cons_cfg['ckc_en']
+    dts_en = args.dts_en or cons_cfg['dts_en']
+    seg_en = 'pc' in cons_cfg and (args.seg_en or cons_cfg['seg_en'])
+    dt_en = 'delta' in time_rpt.opt
+    ckdt_en = not {'pfc', 'pfce'}.isdisjoint(time_rpt.opt)
+
+    if 'pf' in time_rpt.opt:
+        is_dseg_pass, is_ckseg_pass = False, True
+        seg_head = " Segment:  (report path type: full)"
+    elif 'pfc' in time_rpt.opt:
+        is_dseg_pass, is_ckseg_pass = False, False
+        seg_head = " Segment:  (report path type: full_clock)"
+    elif 'pfce' in time_rpt.opt:
+        is_dseg_pass, is_ckseg_pass = False, False
+        seg_head = " Segment:  (report path type: full_clock_expanded)"
+    else:
+        is_dseg_pass, is_ckseg_pass = True, True
+        seg_head = " Segment:  (report path type: unknown)"
+
+    fmt_kv = lambda pairs: " ".join(f"{tag}:{val: .4f}" for tag, val in pairs)
+
     for pid, path in enumerate(time_rpt.path):
-        splen = len(stp:=path.lpath[path.spin].pin)
-        if (plen:=len(edp:=path.lpath[-1].pin)) < splen:
+        lpath, spin, max_dly_en = path.lpath, path.spin, path.max_dly_en
+        splen = len(stp:=lpath[spin].pin)
+        if (plen:=len(edp:=lpath[-1].pin)) < splen:
             plen = splen
 
         ## path information
-        print(" {}".format("=" * 60))
-        if path.max_dly_en:
-            print(" Startpoint: {}".format(stp))
-            print(" Endpoint:   {}".format(edp))
+        out = [_RULE]
+        if max_dly_en:
+            out.append(" Startpoint: {}".format(stp))
+            out.append(" Endpoint:   {}".format(edp))
         elif plen > 80:
-            print(" Startpoint: {}".format(stp))
-            print("             ({} {})".format(path.sed, path.sck))
-            print(" Endpoint:   {}".format(edp))
-            print("             ({} {})".format(path.eed, path.eck))
+            out.append(" Startpoint: {}".format(stp))
+            out.append("             ({} {})".format(path.sed, path.sck))
+            out.append(" Endpoint:   {}".format(edp))
+            out.append("             ({} {})".format(path.eed, path.eck))
         else:
-            print(" Startpoint: {} ({} {})".format(stp.ljust(plen), 
-                                                   path.sed, path.sck))
-            print(" Endpoint:   {} ({} {})".format(edp.ljust(plen), 
-                                                   path.eed, path.eck))
-        print(" Path group: {}".format(path.group))
-        print(" Delay type: {}".format(path.type))
+            out.append(" Startpoint: {} ({} {})".format(stp.ljust(plen), 
+                                                        path.sed, path.sck))
+            out.append(" Endpoint:   {} ({} {})".format(edp.ljust(plen), 
+                                                        path.eed, path.eck))
+        out.append(" Path group: {}".format(path.group))
+        out.append(" Delay type: {}".format(path.type))
         if path.scen is not None:
-            print(" Scenario:   {}".format(path.scen))
-        print(" {}".format("=" * 60))
+            out.append(" Scenario:   {}".format(path.scen))
+        out.append(_RULE)
 
         ## path latency
-        if cons_cfg['slk_on_rpt']:
-            print(" {:26}{: 5.4f}".format(
-                "data latency:", path.arr-path.idly-path.slat-path.sev))
-            print(" {:26}{: 5.4f}".format("arrival:", path.arr))
-            print(" {:26}{: 5.4f}".format("required:", path.req))
-            print(" {:26}{: 5.4f}".format("slack:", path.slk))
+        if slk_on_rpt:
+            out.append(_FMT_VAL("data latency:", dlat_list[pid]))
+            out.append(_FMT_VAL("arrival:", path.arr))
+            out.append(_FMT_VAL("required:", path.req))
+            out.append(_FMT_VAL("slack:", path.slk))
 
             if (path.idly_en or path.odly_en or path.pmarg_en or path.hcd or 
-                cons_cfg['unce_on_rpt'] or cons_cfg['lib_on_rpt']):
-                print(" {}".format("-" * 60))
-
-            if cons_cfg['unce_on_rpt']:
-                print(" {:26}{: 5.4f}".format(
-                    "clock uncertainty:", path.unce))
-            if cons_cfg['lib_on_rpt'] and not path.odly_en:
-                print(" {:26}{: 5.4f}".format(
-                    ("library setup:" if path.type == "max" 
-                    else "library hold"), path.lib))
+                unce_on_rpt or lib_on_rpt):
+                out.append(_SUBRULE)
+
+            if unce_on_rpt:
+                out.append(_FMT_VAL("clock uncertainty:", path.unce))
+            if lib_on_rpt and not path.odly_en:
+                out.append(_FMT_VAL(("library setup:" if path.type == "max" 
+                                     else "library hold"), path.lib))
             if path.idly_en:
-                print(" {:26}{: 5.4f}".format("input delay:", path.idly))
+                out.append(_FMT_VAL("input delay:", path.idly))
             if path.odly_en:
-                print(" {:26}{: 5.4f}".format("output delay:", -1*path.odly))
+                out.append(_FMT_VAL("output delay:", -1*path.odly))
             if path.pmarg_en:
-                print(" {:26}{: 5.4f}".format("path margin:", path.pmarg))
+                out.append(_FMT_VAL("path margin:", path.pmarg))
             for tag, val in path.hcd.items():
-                print(" {}{: 5.4f}".format(f"{tag}:".ljust(26), val))
+                out.append(_FMT_VAL(f"{tag}:", val))
 
-            print(" {}".format("=" * 60))
+            out.append(_RULE)
 
         ## clock latency & check
         is_clk_on_rpt = False
 
-        if cons_cfg['ck_skew_on_rpt']:
+        if ck_skew_on_rpt:
             is_clk_on_rpt = True
-            if not path.max_dly_en:
-                print(" {:26}{: 5.4f}".format("launch clock edge value:", 
-                                                path.sev))
-                print(" {:26}{: 5.4f}".format("capture clock edge value:", 
-                                                path.eev))
-            print(" {:26}{: 5.4f}".format("launch clock latency:", 
-                                            path.slat))
-            if not path.max_dly_en:
-                print(" {:26}{: 5.4f}".format("capture clock latency:", 
-                                                path.elat))
-                print(" {:26}{: 5.4f}".format("crpr:", path.crpr))
-                print(" {:26}{: 5.4f}".format("clock skew:", 
-                                                path.slat-path.elat-path.crpr))
-
-        if (args.ckc_en or cons_cfg['ckc_en']) and not path.max_dly_en:
+            if not max_dly_en:
+                out.append(_FMT_VAL("launch clock edge value:", path.sev))
+                out.append(_FMT_VAL("capture clock edge value:", path.eev))
+            out.append(_FMT_VAL("launch clock latency:", path.slat))
+            if not max_dly_en:
+                out.append(_FMT_VAL("capture clock latency:", path.elat))
+                out.append(_FMT_VAL("crpr:", path.crpr))
+                out.append(_FMT_VAL("clock skew:", skew_list[pid]))
+
+        if ckc_en and not max_dly_en:
             if is_clk_on_rpt:
-                print(" {}".format("-" * 60))
+                out.append(_SUBRULE)
             is_clk_on_rpt = True
 
             gcc_rslt, scc_rslt, ctc_rslt = time_rpt.clock_path_check(
                                             pid=pid, is_dump=args.ckc_dump)
 
-            spath_len = ((path.spin+1) if path.sgpi is None 
-                         else (path.spin-path.sgpi))
+            spath_len = ((spin+1) if path.sgpi is None 
+                         else (spin-path.sgpi))
 
             epath_len = (len(path.cpath) if path.egpi is None 
                          else (len(path.cpath)-path.egpi-1))
             
             col_sz = len(split_lv:=f"{spath_len}/{epath_len}/{scc_rslt[0]}")
-            print(" {:26} {}    {}".format("clock cell type check:", 
-                                            ctc_rslt[0].ljust(col_sz), 
-                                            ctc_rslt[1]))
-            print(" {:26} {}    {}".format("clock source path match:", 
-                                            gcc_rslt[0].ljust(col_sz), 
-                                            gcc_rslt[1]))
-            print(" {:26} {}    (ln:{}:{})".format("clock network path fork:", 
-                                            split_lv, *scc_rslt[1:]))
-
-        if path.max_dly_en:
+            out.append(" {:26} {}    {}".format("clock cell type check:", 
+                                                 ctc_rslt[0].ljust(col_sz), 
+                                                 ctc_rslt[1]))
+            out.append(" {:26} {}    {}".format("clock source path match:", 
+                                                 gcc_rslt[0].ljust(col_sz), 
+                                                 gcc_rslt[1]))
+            out.append(" {:26} {}    (ln:{}:{})".format(
+                "clock network path fork:", split_lv, *scc_rslt[1:]))
+
+        if max_dly_en:
             is_clk_on_rpt = True
-            print(" {:26}{: 5.4f}".format("max delay:", path.max_dly))
+            out.append(_FMT_VAL("max delay:", path.max_dly))
 
-        if is_clk_on_rpt or path.max_dly_en:
-            print(" {}".format("=" * 60))
+        if is_clk_on_rpt or max_dly_en:
+            out.append(_RULE)
 
         ## clock & path delta
-        if args.dts_en or cons_cfg['dts_en']:
-            if 'delta' in time_rpt.opt:
+        if dts_en:
+            if dt_en:
                 ddt_val = "{: 5.4f}".format(path.ddt)
-                if not {'pfc', 'pfce'}.isdisjoint(time_rpt.opt):
+                if ckdt_en:
                     sdt_val = "{:5.4f}".format(path.sdt)
                     edt_val = "{:5.4f}".format(path.edt)
                 else:
@@ -272,75 +374,48 @@ def report_summary(args, range_list: list):
             else:
                 ddt_val, sdt_val, edt_val = 'N/A', 'N/A', 'N/A'
 
-            print(" {:26}{} : {} : {}".format("total delta (D:L:C):", 
-                                              ddt_val, sdt_val, edt_val))
-            print(" {}".format("=" * 60))
+            out.append(" {:26}{} : {} : {}".format("total delta (D:L:C):", 
+                                                   ddt_val, sdt_val, edt_val))
+            out.append(_RULE)
 
         ## path segment
-        if 'pc' in cons_cfg and (args.seg_en or cons_cfg['seg_en']):
+        if seg_en:
             seg_dict = time_rpt.get_path_segment(pid)
-
-            if 'pf' in time_rpt.opt:
-                is_dseg_pass, is_ckseg_pass = False, True
-                print(" Segment:  (report path type: full)")
-            elif 'pfc' in time_rpt.opt:
-                is_dseg_pass, is_ckseg_pass = False, False
-                print(" Segment:  (report path type: full_clock)")
-            elif 'pfce' in time_rpt.opt:
-                is_dseg_pass, is_ckseg_pass = False, False
-                print(" Segment:  (report path type: full_clock_expanded)")
-            else:
-                is_dseg_pass, is_ckseg_pass = True, True
-                print(" Segment:  (report path type: unknown)")
+            out.append(seg_head)
 
             # data latency & delta
             if not is_dseg_pass:
-                if cons_cfg['seg_dlat_on_rpt'] or cons_cfg['seg_ddt_on_rpt']:
-                    print(" {}".format("-" * 60))
-                if cons_cfg['seg_dlat_on_rpt']:
-                    print(" data latency: ", end='')
-                    for tag, val in seg_dict['dlat']:
-                        print("{}:{: .4f} ".format(tag, val), end='')
-                    print()
-                if cons_cfg['seg_ddt_on_rpt']:
-                    print(" data delta:   ", end='')
-                    for tag, val in seg_dict['ddt']:
-                        print("{}:{: .4f} ".format(tag, val), end='')
-                    print()
+                if seg_dlat_on_rpt or seg_ddt_on_rpt:
+                    out.append(_SUBRULE)
+                if seg_dlat_on_rpt:
+                    out.append(" data latency: " + fmt_kv(seg_dict['dlat']))
+                if seg_ddt_on_rpt:
+                    out.append(" data delta:   " + fmt_kv(seg_dict['ddt']))
 
             if not is_ckseg_pass:
                 # launch clock latency & delta
-                if cons_cfg['seg_slat_on_rpt'] or cons_cfg['seg_sdt_on_rpt']:
-                    print(" {}".format("-" * 60))
-                if cons_cfg['seg_slat_on_rpt']:
-                    print(" launch clk latency:  ", end='')
-                    print("SC:{: .4f} ".format(path.sslat), end='')
-                    for tag, val in seg_dict['slat']:
-                        print("{}:{: .4f} ".format(tag, val), end='')
-                    print()
-                if cons_cfg['seg_sdt_on_rpt']:
-                    print(" launch clk delta:    ", end='')
-                    for tag, val in seg_dict['sdt']:
-                        print("{}:{: .4f} ".format(tag, val), end='')
-                    print()
+                if seg_slat_on_rpt or seg_sdt_on_rpt:
+                    out.append(_SUBRULE)
+                if seg_slat_on_rpt:
+                    out.append(" launch clk latency:  " + 
+                               fmt_kv([('SC', path.sslat), *seg_dict['slat']]))
+                if seg_sdt_on_rpt:
+                    out.append(" launch clk delta:    " + 
+                               fmt_kv(seg_dict['sdt']))
 
                 ## capture clock latency & delta
-                if cons_cfg['seg_elat_on_rpt'] or cons_cfg['seg_edt_on_rpt']:
-                    print(" {}".format("-" * 60))
-                if cons_cfg['seg_elat_on_rpt']:
-                    print(" capture clk latency: ", end='')
-                    print("SC:{: .4f} ".format(path.eslat), end='')
-                    for tag, val in seg_dict['elat']:
-                        print("{}:{: .4f} ".format(tag, val), end='')
-                    print()
-                if cons_cfg['seg_edt_on_rpt']:
-                    print(" capture clk delta:   ", end='')
-                    for tag, val in seg_dict['edt']:
-                        print("{}:{: .4f} ".format(tag, val), end='')
-                    print()
-
-            print(" {}".format("=" * 60))
-        print()
+                if seg_elat_on_rpt or seg_edt_on_rpt:
+                    out.append(_SUBRULE)
+                if seg_elat_on_rpt:
+                    out.append(" capture clk latency: " + 
+                               fmt_kv([('SC', path.eslat), *seg_dict['elat']]))
+                if seg_edt_on_rpt:
+                    out.append(" capture clk delta:   " + 
+                               fmt_kv(seg_dict['edt']))
+
+            out.append(_RULE)
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
 
     ## show time bar chart
     bar_dtype = set()
@@ -371,65 +446,33 @@ def report_summary(args, range_list: list):
 def show_time_bar(path: TimePath, path_opt: set, cons_cfg: dict, 
                   bar_dtype: set, bar_ptype: set, is_rev: bool):
     """Show Time Path Barchart"""
-    db, db_dict = [], {}
+    import matplotlib.pyplot as plt  # deferred: only the bar view needs it
 
-    ## [c]apacitance
-    if 'c' in bar_dtype and 'cap' in path_opt:
-        db_dict['c'], data = [], []
-        for cid, cell in enumerate(path.lpath):
-            data.append(cell.cap)
-            if cid == path.spin:
-                if 'l' in bar_ptype:
-                    db_dict['c'].append(["Launch Clk Cap (pf)", data.copy()])
-                if 'd' not in bar_ptype:
-                    data = None
-                    break
-                if 'f' not in bar_ptype:
-                    data = [data[-1]]
-        ddata = data
-
-        if 'c' in bar_ptype:
-            data = []
-            for cell in path.cpath:
-                data.append(cell.cap)
-            db_dict['c'].append(["Capture Clk Cap (pf)", data])
-
-        if ddata is not None:
-            db_dict['c'].append(["Path Cap (pf)", ddata])
-    else:
-        bar_dtype.discard('c')
+    db, db_dict = [], {}
 
     dtype_list = [
+        ['c', 'cap', "Cap (pf)"],         # [c]apacitance
         ['p', 'phy', "Distance (um)"],    # [p]hysical distance
         ['t', 'tran', "Tran (ns)"],       # [t]ransition
         ['d', 'delta', "Delta (ns)"],     # [d]elta
         ['i', 'incr', "Increment (ns)"],  # latency [i]ncrement
     ]
 
+    lpath, spin = path.lpath, path.spin
+    dpath = lpath if 'f' in bar_ptype else lpath[spin:]
     for key, tag, title in dtype_list:
         if key in bar_dtype and tag in path_opt:
-            db_dict[key], data = [], []
-            for cid, cell in enumerate(path.lpath):
-                data.append(cell[tag])
-                if cid == path.spin:
-                    if 'l' in bar_ptype:
-                        db_dict[key].append(
-                            [f"Launch Clk {title}", data.copy()])
-                    if 'd' not in bar_ptype:
-                        data = None
-                        break
-                    if 'f' not in bar_ptype:
-                        data = [data[-1]]
-            ddata = data
-
+            db_dict[key] = []
+            getter = operator.attrgetter(tag)
+            if 'l' in bar_ptype:
+                db_dict[key].append(
+                    [f"Launch Clk {title}", list(map(getter, lpath[:spin+1]))])
             if 'c' in bar_ptype:
-                data = []
-                for cell in path.cpath:
-                        data.append(cell[tag])
-                db_dict[key].append([f"Capture Clk {title}", data])
-
-            if ddata is not None:
-                db_dict[key].append([f"Path {title}", ddata])
+                db_dict[key].append(
+                    [f"Capture Clk {title}", list(map(getter, path.cpath))])
+            if 'd' in bar_ptype:
+                db_dict[key].append(
+                    [f"Path {title}", list(map(getter, dpath))])
         else:
             bar_dtype.discard(key)
 
@@ -470,9 +513,18 @@ def show_time_bar(path: TimePath, path_opt: set, cons_cfg: dict,
         fig, axs = plt.subplots(cy_cnt, cx_cnt, constrained_layout=True)
 
         pt_anno_list = [[] for i in range(dtype_cnt*ptype_cnt)]
+        pt_bbox_list = [None] * (dtype_cnt*ptype_cnt)  # (axes, bar extents)
         bbox = dict(boxstyle='round', fc='#ffcc00', alpha=0.6)
         arrow = dict(arrowstyle='->', connectionstyle="arc3,rad=0.")
 
+        ## pin hierarchy and shortened names for the bubbles (shared by all 
+        ## subplots and reused by the PM/RESET keys)
+        pin_toks, pin_disp = {}, {}
+        for ce in (*path.lpath, *path.cpath):
+            pin_toks[ce.pin] = toks = ce.pin.split('/')
+            pin_disp[ce.pin] = (f".../{toks[-2]}/{toks[-1]}" if len(toks) > 2 
+                                else ce.pin)
+
         if 'ct' in bar_dtype:
             is_ct_chk, last_dtype = True, dtype_cnt-1
         else:
@@ -488,44 +540,56 @@ def show_time_bar(path: TimePath, path_opt: set, cons_cfg: dict,
 
             for x in range(ptype_cnt):
                 sdb = db[dtype_off+x]
+                sdb[1] = arr = np.asarray(sdb[1], dtype=np.float64)
                 aid = (cx_cnt*x+y) if is_rev else (cx_cnt*y+x)
                 labels = list(slg[x].keys())
                 handles = [plt.Rectangle((0,0), 1, 1, color=slg[x][label]) 
                            for label in labels]
-                level = range(0, len(sdb[1]))
+                level = range(0, len(arr))
 
-                max_dy = max(sdb[1])
-                min_dy = 0 if (min_dy:=min(sdb[1])) > 0 else min_dy
-                dy_off = 2.0 if ct_act else (max_dy-min_dy)
+                arr_min, arr_max = float(arr.min()), float(arr.max())
+                min_dy = 0.0 if arr_min > 0 else arr_min
+                dy_off = 2.0 if ct_act else (arr_max-min_dy)
                 dx, dy_rt = -0.5, 0.5
                 dy = min_dy + dy_off * dy_rt
 
-                xlist = [*level]
                 if spin_pos[0] is not None and spin_pos[0] == x:
-                    xlist.append(xlist[spin_pos[1]])
-                    del xlist[spin_pos[1]]
+                    # draw the data startpoint bar last (on top)
+                    dsp = spin_pos[1]
+                    xlist = [*range(dsp), *range(dsp+1, len(arr)), dsp]
+                else:
+                    xlist = [*level]
+
+                xs = np.asarray(xlist)
+                ys = np.full(len(xs), 0.5) if ct_act else arr[xs]
 
                 axs = plt.subplot(cy_cnt, cx_cnt, aid+1)
-                for ix in xlist:
-                    toks = slv_ce[x][ix].pin.split('/')
-                    pin = (f".../{toks[-2]}/{toks[-1]}" if len(toks) > 2 
-                           else slv_ce[x][ix].pin)
+                bars = axs.bar(xs, ys, width=1.0, 
+                               color=[slv_c[x][ix] for ix in xlist], 
+                               ec=[slv_ec[x][ix] for ix in xlist])
+                pt_bbox_list[aid] = (axs, np.column_stack((
+                    xs - 0.5, xs + 0.5, 
+                    np.minimum(ys, 0.0), np.maximum(ys, 0.0))))
+
+                for pt, ix, iy in zip(bars.patches, xlist, ys):
+                    pt.set_hatch(slv_ha[x][ix])
+                    pin = pin_disp[slv_ce[x][ix].pin]
                     if ct_act:
-                        val, iy = f"lib: {slv_ce[x][ix].cell}", 0.5
+                        val = f"lib: {slv_ce[x][ix].cell}"
                     else:
-                        val = "val: {:.4f}".format(iy:=sdb[1][ix])
+                        val = "val: {:.4f}".format(iy)
 
-                    comm = "pin: {}\n{}\nln: {}".format(
-                                pin, val, slv_ce[x][ix].ln)
-                    pt, = axs.bar(ix, iy, width=1.0, 
-                                  color=slv_c[x][ix], hatch=slv_ha[x][ix], 
-                                  ec=slv_ec[x][ix])
+                    pin_ln, ln = f"pin: {pin}", f"ln: {slv_ce[x][ix].ln}"
+                    comm = f"{pin_ln}\n{val}\n{ln}"
                     anno = plt.annotate(comm, xy=(ix,iy), xytext=(dx,dy), 
                                         bbox=bbox, arrowprops=arrow, size=10)
                     anno.set_visible(False)
+                    ## bubble lines: pin[\nlib]\nval\nln
                     info = {'dx': dx, 'min_dy': min_dy, 
                             'dy_off': dy_off, 'dy_rt': dy_rt, 
-                            'ce': slv_ce[x][ix], 'plv': 2, 'ct': ct_act}
+                            'ce': slv_ce[x][ix], 'plv': 2, 'ct': ct_act, 
+                            'pin_toks': pin_toks[slv_ce[x][ix].pin], 
+                            'pin': pin_ln, 'lib': '', 'mid': val, 'tail': ln}
                     pt_anno_list[aid].append([pt, anno, info])
 
                 if ct_act:
@@ -537,6 +601,11 @@ def show_time_bar(path: TimePath, path_opt: set, cons_cfg: dict,
                 axs.set_xticks(level, [])
                 axs.legend(handles, labels, loc='upper left', ncol=len(labels))
 
+        ## flat annotation list with the aligned x offsets (for LR shift)
+        anno_objs = [anno for sub in pt_anno_list for _, anno, _ in sub]
+        anno_x = np.array([info['dx'] for sub in pt_anno_list 
+                           for *_, info in sub], dtype=np.float64)
+
         # def on_move(event):
         #     is_vis_chg = False
         #     for i in range(len(pt_anno_list)):
@@ -552,81 +621,94 @@ def show_time_bar(path: TimePath, path_opt: set, cons_cfg: dict,
             ev_key = str(event.button)
             # print(ev_key)
             if ev_key == 'MouseButton.LEFT':
-                for i in range(len(pt_anno_list)):
-                    is_act, vis_list = False, []
-                    for pt, *_ in pt_anno_list[i]:
-                        vis_list.append(pt.contains(event)[0] == True)
-                        is_act = is_act or vis_list[-1]
-                    if is_act:
-                        for is_vis, pt_anno in zip(vis_list, pt_anno_list[i]):
+                ex, ey = event.xdata, event.ydata
+                for sub, (axs, bboxes) in zip(pt_anno_list, pt_bbox_list):
+                    if ex is None:
+                        vis_list = [pt.contains(event)[0] == True 
+                                    for pt, *_ in sub]
+                    elif event.inaxes is axs:
+                        vis_list = ((bboxes[:,0] <= ex) & (ex < bboxes[:,1]) & 
+                                    (bboxes[:,2] <= ey) & (ey < bboxes[:,3]))
+                    else:
+                        continue
+                    if any(vis_list):
+                        for is_vis, pt_anno in zip(vis_list, sub):
                             if is_vis != pt_anno[1].get_visible():
-                                pt_anno[1].set_visible(is_vis)
+                                pt_anno[1].set_visible(bool(is_vis))
             elif ev_key == 'MouseButton.RIGHT':
-                for i in range(len(pt_anno_list)):
-                    for pt, anno, _ in pt_anno_list[i]:
+                for sub in pt_anno_list:
+                    for pt, anno, _ in sub:
                         anno.set_visible(False)
             plt.draw()
 
         def on_key(event):
             ev_key, val = key_event_check(str(event.key))
             # print(str(event.key))
+            is_dirty = False
             match ev_key:
                 case 'ESC':
-                    for i in range(len(pt_anno_list)):
-                        for pt, anno, _ in pt_anno_list[i]:
-                            anno.set_visible(False)
-                    plt.draw()
+                    for sub in pt_anno_list:
+                        for pt, anno, _ in sub:
+                            if anno.get_visible():
+                                anno.set_visible(False)
+                                is_dirty = True
                 case 'UD':
-                    for i in range(len(pt_anno_list)):
-                        for pt, anno, info in pt_anno_list[i]:
+                    for sub in pt_anno_list:
+                        for pt, anno, info in sub:
                             info['dy_rt'] += val 
                             anno.set_y(info['min_dy']
                                        + info['dy_off']*info['dy_rt'])
-                    plt.draw()
+                    is_dirty = True
                 case 'LR':
-                    for i in range(len(pt_anno_list)):
-                        for pt, anno, info in pt_anno_list[i]:
-                            anno.set_x(anno._x+val)
-                    plt.draw()
+                    anno_x[:] += val
+                    for anno, x in zip(anno_objs, anno_x.tolist()):
+                        anno.set_x(x)
+                    is_dirty = True
                 case 'PM':
-                    for i in range(len(pt_anno_list)):
-                        for pt, anno, info in pt_anno_list[i]:
+                    for sub in pt_anno_list:
+                        for pt, anno, info in sub:
                             info['plv'] = (plv:=info['plv']+val)
-                            toks = (pin:=info['ce'].pin).split('/')
+                            toks, pin = info['pin_toks'], info['ce'].pin
                             if len(toks) > plv:
-                                pin = ""
-                                for i in range(-1, -1-plv, -1):
-                                    pin = "/{}".format(toks[i]) + pin
-                                pin = '...' + pin
-                            toks = anno.get_text().split('\n')
-                            anno.set_text(
-                                    f"pin: {pin}\n{toks[-2]}\n{toks[-1]}")
-                    plt.draw()
+                                pin = ('.../' + '/'.join(toks[-plv:]) 
+                                       if plv > 0 else '...')
+                            pin_ln = "pin: " + pin
+                            if pin_ln != info['pin'] or info['lib']:
+                                info['pin'], info['lib'] = pin_ln, ''
+                                anno.set_text("\n".join(
+                                    (pin_ln, info['mid'], info['tail'])))
+                                is_dirty = True
                 case 'BT':
-                    for i in range(len(pt_anno_list)):
-                        for pt, anno, info in pt_anno_list[i]:
-                            toks = anno.get_text().split('\n')
-                            if val == 2 and info['ct'] is False:
-                                toks[0] = "{}\nlib: {}".format(
-                                            toks[0], info['ce'].cell)
-                            anno.set_text(f"{toks[0]}\n{toks[-2]}\n{toks[-1]}")
-                    plt.draw()
+                    for sub in pt_anno_list:
+                        for pt, anno, info in sub:
+                            lib = ("\nlib: " + str(info['ce'].cell) 
+                                   if val == 2 and info['ct'] is False else '')
+                            if lib != info['lib']:
+                                info['lib'] = lib
+                                anno.set_text("\n".join((
+                                    info['pin'] + lib, info['mid'], 
+                                    info['tail'])))
+                                is_dirty = True
                 case 'RESET':
-                    for i in range(len(pt_anno_list)):
-                        for pt, anno, info in pt_anno_list[i]:
-                            if anno._x == -0.5 and info['dy_rt'] == 0.5:
-                                info['plv'] = 2
-                                toks = (pin:=info['ce'].pin).split('/')
-                                if len(toks) > 2:
-                                    pin = f'.../{toks[-2]}/{toks[-1]}'
-                                toks = anno.get_text().split('\n')
-                                anno.set_text(
-                                        f"pin: {pin}\n{toks[-2]}\n{toks[-1]}")
-                            info['dy_rt'] = 0.5
-                            anno.set_x(-0.5)
-                            anno.set_y(info['min_dy']
-                                       + info['dy_off']*info['dy_rt'])
-                    plt.draw()
+                    x_home = (anno_x == -0.5).tolist()  # mirrored anno x
+                    for (pt, anno, info), is_home in zip(
+                            itertools.chain.from_iterable(pt_anno_list), x_home):
+                        if is_home and info['dy_rt'] == 0.5:
+                            info['plv'] = 2
+                            toks, pin = info['pin_toks'], info['ce'].pin
+                            if len(toks) > 2:
+                                pin = '.../' + toks[-2] + '/' + toks[-1]
+                            info['pin'], info['lib'] = "pin: " + pin, ''
+                            anno.set_text("\n".join(
+                                (info['pin'], info['mid'], info['tail'])))
+                        info['dy_rt'] = 0.5
+                        anno.set_x(-0.5)
+                        anno.set_y(info['min_dy'] + info['dy_off']*0.5)
+                    anno_x[:] = -0.5
+                    is_dirty = True
+
+            if is_dirty:
+                fig.canvas.draw_idle()
 
         # fig.canvas.mpl_connect('motion_notify_event', on_move)
         fig.canvas.mpl_connect('button_press_event', on_mouse)
@@ -637,112 +719,125 @@ def show_time_bar(path: TimePath, path_opt: set, cons_cfg: dict,
 def get_time_bar_info(cmp_id: str, default_tag: str, seg_dict: None, 
                       bar_ptype: set, path: TimePath, is_order=False):
     """Get the time bar information."""
-    pal_cnt = len(Palette.hist)
-    hist_palette = {}
+    pal_hist = Palette.hist
+    pal_cnt = len(pal_hist)
     if seg_dict is not None and is_order:
-        for i, key in enumerate(seg_dict.keys()):
-            hist_palette[key] = Palette.hist[i%pal_cnt]
+        hist_palette = dict(zip(seg_dict, itertools.cycle(pal_hist)))
     else:
-        for i in range(pal_cnt):
-            hist_palette[i] = Palette.hist[i]
+        hist_palette = dict(enumerate(pal_hist))
+    palette_get = hist_palette.get
 
     if seg_dict is None:
-        default_color = Palette.hist[0]
+        default_color = pal_hist[0]
         init_tag = None
     else:
         default_color = Palette.hist_default 
         init_tag = default_tag if default_tag in seg_dict else None
+    init_lg = {default_tag: default_color} if init_tag is None else {}
 
     bar_lg, spin_pos = [], (None, None)
     lv_ce, lv_c, lv_ha, lv_ec = [], [], [], []
 
-    for type_ in ('l', 'c', 'd'):
-        if type_ in bar_ptype:
-            tag, pal_idx = init_tag, -1
-            bar_lg_path = ({default_tag: default_color} if init_tag is None 
-                           else {})
-            lv_ce_path, lv_c_path, lv_ha_path, lv_ec_path  = [], [], [], []
-            s_path = path.cpath if type_ == 'c' else path.lpath
-            for cid, cell in enumerate(s_path):
-                if seg_dict is None:
-                    pass
-                elif tag is None:
+    ## bound matchers, reused for every cell of every path
+    get_id = operator.attrgetter(cmp_id)
+    spin, has_seg = path.spin, seg_dict is not None
+    has_f = 'f' in bar_ptype
+    path_types = [type_ for type_ in ('l', 'c', 'd') if type_ in bar_ptype]
+    if has_seg:
+        seg_items = [(key, ps_re.fullmatch) for key, ps_re in seg_dict.items()]
+        seg_fm = dict(seg_items)
+
+    for type_ in path_types:
+        tag, pal_idx = init_tag, -1
+        bar_lg_path = init_lg.copy()
+        s_path = path.cpath if type_ == 'c' else path.lpath
+        is_d = type_ == 'd'
+        do_reset = is_d and not has_f
+        n, base = len(s_path), 0
+        lv_ce_path, lv_c_path = [None] * n, [None] * n
+        lv_ha_path, lv_ec_path = [''] * n, ['k'] * n
+        for cid, cell in enumerate(s_path):
+            if has_seg:
+                cid_val = get_id(cell)
+                if tag is None or seg_fm[tag](cid_val) is None:
                     new_tag = init_tag 
-                    for key, ps_re in seg_dict.items():
-                        if (m:=ps_re.fullmatch(cell[cmp_id])):
-                            new_tag = key
-                            break
-                    tag = new_tag
-                elif seg_dict[tag].fullmatch(cell[cmp_id]) is None:
-                    new_tag = init_tag
-                    for key, ps_re in seg_dict.items():
-                        if (m:=ps_re.fullmatch(cell[cmp_id])):
+                    for key, fullmatch in seg_items:
+                        if fullmatch(cid_val):
                             new_tag = key
                             break
                     tag = new_tag
 
-                if cid == path.spin and type_ == 'd' and 'f' not in bar_ptype:
-                    pal_idx = -1
-                    bar_lg_path = (
-                        {default_tag: default_color} if init_tag is None 
-                        else {})
-                    lv_ce_path, lv_c_path = [], []
-                    lv_ha_path, lv_ec_path = [], []
-
-                key = default_tag if tag is None else tag
-                if key not in bar_lg_path:
-                    if is_order:
-                        bar_lg_path[key] = hist_palette[key]
-                    else:
-                        pal_idx += 1
-                        bar_lg_path[key] = hist_palette[pal_idx%pal_cnt]
-
-                lv_ce_path.append(cell)
-                lv_c_path.append(bar_lg_path[key])
-                if cid == path.spin and type_ == 'd':
-                    spin_pos = (len(lv_ha), len(lv_ha_path))
-                    lv_ha_path.append('/')
-                    lv_ec_path.append('b')
-                else:
-                    lv_ha_path.append('')
-                    lv_ec_path.append('k')
-
-            if seg_dict is not None and is_order:
-                m_bar_lg_path = {default_tag: default_color}
-                for key in seg_dict.keys():
-                    if key in bar_lg_path:
-                        m_bar_lg_path[key] = bar_lg_path[key]
-            else:
-                m_bar_lg_path = bar_lg_path
+            if do_reset and cid == spin:
+                pal_idx = -1
+                bar_lg_path = init_lg.copy()
+                base = cid
+                lv_ce_path, lv_c_path = [None] * (n-cid), [None] * (n-cid)
+                lv_ha_path, lv_ec_path = [''] * (n-cid), ['k'] * (n-cid)
+
+            key = default_tag if tag is None else tag
+            if is_order:
+                color = bar_lg_path.setdefault(key, palette_get(key))
+            elif (color:=bar_lg_path.get(key)) is None:
+                pal_idx += 1
+                color = bar_lg_path[key] = hist_palette[pal_idx%pal_cnt]
+
+            idx = cid - base
+            lv_ce_path[idx] = cell
+            lv_c_path[idx] = color
+            if is_d and cid == spin:
+                spin_pos = (len(lv_ha), idx)
+                lv_ha_path[idx] = '/'
+                lv_ec_path[idx] = 'b'
+
+        if has_seg and is_order:
+            m_bar_lg_path = {
+                default_tag: default_color, 
+                **{key: bar_lg_path[key] for key in seg_dict 
+                   if key in bar_lg_path}}
+        else:
+            m_bar_lg_path = bar_lg_path
 
-            bar_lg.append(m_bar_lg_path)
-            lv_ce.append(lv_ce_path)
-            lv_c.append(lv_c_path)
-            lv_ha.append(lv_ha_path)
-            lv_ec.append(lv_ec_path)
+        bar_lg.append(m_bar_lg_path)
+        lv_ce.append(lv_ce_path)
+        lv_c.append(lv_c_path)
+        lv_ha.append(lv_ha_path)
+        lv_ec.append(lv_ec_path)
 
     return (bar_lg, lv_ce, lv_c, lv_ha, lv_ec), spin_pos
 
 
+_KEY_TABLE = {
+    'escape': ('ESC'  ,  0  ),  # remove all comment bubble
+    'up':     ('UD'   ,  0.1),  # up shift bubble
+    'down':   ('UD'   , -0.1),  # down shift bubble
+    'left':   ('LR'   , -0.5),  # left shift bubble
+    'right':  ('LR'   ,  0.5),  # right shift bubble
+    'a':      ('PM'   ,  1  ),  # increase pin hierarchical
+    'd':      ('PM'   , -1  ),  # decrease pin hierarchical
+    '1':      ('BT'   ,  1  ),  # bubble type 1 (pin, val, ln)
+    '2':      ('BT'   ,  2  ),  # bubble type 2 (pin, lib, val, ln)
+    'r':      ('RESET',  0  ),  # reset bubble
+}
+_KEY_NONE = ("NONE", 0)
+
+
 def key_event_check(action):
     """Check Key Event"""
-    if action == 'escape': return 'ESC'  ,  0    # remove all comment bubble
-    if action == 'up':     return 'UD'   ,  0.1  # up shift bubble
-    if action == 'down':   return 'UD'   , -0.1  # down shift bubble
-    if action == 'left':   return 'LR'   , -0.5  # left shift bubble
-    if action == 'right':  return 'LR'   ,  0.5  # right shift bubble
-    if action == 'a':      return 'PM'   ,  1    # increase pin hierarchical
-    if action == 'd':      return 'PM'   , -1    # decrease pin hierarchical
-    if action == '1':      return 'BT'   ,  1    # bubble type 1 (pin, val, ln)
-    if action == '2':      return 'BT'   ,  2    # bubble type 2 (pin, lib, val, ln)
-    if action == 'r':      return 'RESET',  0    # reset bubble
-    return "NONE", 0
+    return _KEY_TABLE.get(action, _KEY_NONE)
 
 
 ##############################################################################
 ### Main
 
 
+### path range argument (st[:ed][+nu])
+_RANGE_RE = re.compile(r"(?P<st>\d+)(?::(?P<ed>\d+))?(?:\+(?P<nu>\d+))?")
+
+### bar view choices (hashed lookup, listed in order on error)
+_BARD_CHOICES = dict.fromkeys(('p', 'c', 't', 'd', 'i', 'ct')).keys()
+_BARP_CHOICES = dict.fromkeys(('f', 'd', 'l', 'c')).keys()
+
+
 def create_argparse() -> argparse.ArgumentParser:
     """Create Argument Parser"""
     parser = argparse.ArgumentParser(
@@ -770,11 +865,11 @@ def create_argparse() -> argparse.ArgumentParser:
     parser.add_argument('-seg', dest='seg_en', action='store_true', 
                             help="enable path segment")
     parser.add_argument('-bar', dest='bar', metavar='<pat>', nargs='*', 
-                            choices=['p','c','t','d','i', 'ct'],
+                            choices=_BARD_CHOICES,
                             help="bar view data type select\n" +
                                  "(p:distance, c:cap, t:tran, d:delta, i:incr, ct:cell_type)") 
     parser.add_argument('-barp', dest='bar_ptype', metavar='<pat>', nargs='*', 
-                            choices=['f','d','l','c'],
+                            choices=_BARP_CHOICES,
                             help="bar view path type select\n" +
                                  "(f:full data, d:data, l:launch clk, c:capture clk)") 
     parser.add_argument('-bars', dest='bars', metavar='<tag>', 
@@ -800,9 +895,9 @@ def main():
 
     range_list = []
     if args.range is not None:
-        range_re = re.compile(r"(?P<st>\d+)(?::(?P<ed>\d+))?(?:\+(?P<nu>\d+))?")
+        range_fm = _RANGE_RE.fullmatch
         for range_ in args.range.split(','):
-            if (m:=range_re.fullmatch(range_)):
+            if (m:=range_fm(range_)):
                 st = int(m.group('st'))
                 ed = None if (ed:=m.group('ed')) is None else int(ed)
                 nu = None if (nu:=m.group('nu')) is None else int(nu)
@@ -5,6 +5,8 @@
 """
 Common Function of EDA-Aid-Tool
 """
+import functools
+
 
 PKG_VERSION = "EDA-Aid-Tool 2023.09-SP1 (dev.1)"
 DC_AREA_VER = "1.0.0.a1"
@@ -15,26 +17,32 @@ PT_TS_VER   = "1.0.0.a8"
 PT_ANA_VER  = "1.0.0.a1"
 
 
+@functools.lru_cache(maxsize=64)
+def _limits(bits: int, is_signed: bool) -> tuple:
+    """Value range, mask and sign bit of a 'bits'-wide integer"""
+    mask = (1 << bits) - 1
+    if is_signed:
+        if bits < 1:
+            raise ValueError("signed number needs at least 1 bit")
+        sign_bit = 1 << (bits - 1)
+        return -sign_bit, sign_bit - 1, mask, sign_bit
+    return 0, mask, mask, 0
+
+
 def str2int(str_: str, is_signed: bool=False, bits: int=32) -> int:
     """Convert string to integer (with HEX check)"""
+    lo, hi, mask, sign_bit = _limits(bits, is_signed)
     if str_.startswith('0x') or str_.startswith('0X') :
         num = int(str_, 16)
-        if num >> bits:
+        if num & ~mask:
             raise ValueError("number overflow")
-        if is_signed:
-            sign = num >> (bits - 1)
-            num |= ~((sign << bits) - 1)
+        if is_signed and num & sign_bit:
+            num -= mask + 1
     else:
         num = int(str_)
-        if is_signed:
-            bits -= 1
         if not is_signed and num < 0:
             raise ValueError("negative value founded in unsigned mode.")
-        elif num > 0 and abs(num) >= (1 << bits):
-            raise ValueError("number overflow")
-        elif num < 0 and abs(num) > (1 << bits):
+        elif not (lo <= num <= hi):
             raise ValueError("number overflow")
             
     return num
-
-